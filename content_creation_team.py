@@ -16,26 +16,218 @@ Features:
 - Professional content output
 """
 
+import os
+
+# CrewAI resolves its memory storage directory (under the user data dir)
+# when it is imported, so the crew's long-term memory location is set first
+os.environ.setdefault("CREWAI_STORAGE_DIR", "content_creation_team")
+
 from crewai import Agent, Task, Crew, Process
 from crewai.llm import LLM
+try:
+    from crewai.events import LLMStreamChunkEvent, crewai_event_bus
+except ImportError:  # older releases only have the original module
+    from crewai.utilities.events import LLMStreamChunkEvent, crewai_event_bus
 from crewai_tools import SerperDevTool
 from dotenv import load_dotenv
-import os
+from pathlib import Path
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import threading
+
+import diskcache
+import litellm
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 # Load environment variables
 load_dotenv()
+GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+
+logger = logging.getLogger(__name__)
+
+# Gemini models per agent; the Editor's review pass runs on a lighter model
+WRITER_MODEL = os.getenv("GEMINI_WRITER_MODEL", "gemini/gemini-2.0-flash-exp")
+EDITOR_MODEL = os.getenv("GEMINI_EDITOR_MODEL", "gemini/gemini-2.0-flash-lite")
+SEO_MODEL = os.getenv("GEMINI_SEO_MODEL", "gemini/gemini-2.0-flash-exp")
+
+# Sampling and output limits; a deterministic Editor keeps edits repeatable
+WRITER_TEMPERATURE = 0.8
+EDITOR_TEMPERATURE = 0.3
+TOKENS_PER_WORD = 1.6
+SEO_EXTRA_TOKENS = 1024  # room for meta data, social snippets and recommendations
+
+# Stream agent thoughts and LLM output to stdout (off by default)
+VERBOSE = os.getenv("CREW_VERBOSE", "0") == "1"
+
+# Keep-alive HTTP session shared by all Serper requests
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_maxsize=20))
+
+# On-disk cache of Serper responses; identical queries recur across runs
+SERPER_CACHE_TTL = 86400
+_SERPER_CACHE = diskcache.Cache("./.serper_cache", size_limit=2**30)
+
+class CachedSerperDevTool(SerperDevTool):
+    """
+    SerperDevTool that serves repeated queries from a local disk cache and
+    sends the rest through one pooled HTTP session shared across agents.
+    """
+    
+    def _make_api_request(self, search_query, search_type):
+        payload = {"q": search_query, "num": self.n_results}
+        if self.country:
+            payload["gl"] = self.country
+        if self.location:
+            payload["location"] = self.location
+        if self.locale:
+            payload["hl"] = self.locale
+        
+        search_url = self._get_search_url(search_type)
+        key = hashlib.blake2b(
+            f"{search_url} {json.dumps(payload, sort_keys=True)}".encode(), digest_size=16
+        ).hexdigest()
+        cached = _SERPER_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        headers = {
+            "X-API-KEY": os.environ["SERPER_API_KEY"],
+            "content-type": "application/json"
+        }
+        
+        try:
+            response = _HTTP_SESSION.post(search_url, headers=headers, json=payload, timeout=10)
+            response.raise_for_status()
+            results = response.json()
+        except json.JSONDecodeError as e:
+            # Checked first: requests' JSONDecodeError is also a RequestException
+            logger.error("Error decoding JSON response: %s (response content: %s)", e, response.content)
+            raise
+        except requests.exceptions.RequestException as e:
+            content = e.response.content if e.response is not None else None
+            logger.error("Error making request to Serper API: %s (response content: %s)", e, content)
+            raise
+        
+        if not results:
+            logger.error("Empty response from Serper API")
+            raise ValueError("Empty response from Serper API")
+        
+        _SERPER_CACHE.set(key, results, expire=SERPER_CACHE_TTL)
+        return results
+
+# Shared Serper search tool, reused by the Writer and SEO agents
+_SERPER_TOOL = CachedSerperDevTool()
+
+# Streamed SEO output sinks, keyed by the id of the request's SEO LLM copy
+_STREAM_SINKS = {}
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _forward_stream_chunk(source, event):
+    """Pass a streamed LLM chunk to the request that owns the emitting LLM."""
+    sink = _STREAM_SINKS.get(id(source))
+    if sink:
+        sink(event.chunk)
+
+# Response cache settings
+CACHE_PATH = Path.home() / ".cache" / "content_team" / "cache.json"
+EMBEDDING_MODEL = "gemini/text-embedding-004"
+SEMANTIC_THRESHOLD = 0.9
+
+# Provider errors worth retrying before falling back to simulation mode
+TRANSIENT_ERRORS = (
+    litellm.RateLimitError,
+    litellm.ServiceUnavailableError,
+    litellm.APIConnectionError,
+    litellm.Timeout
+)
+_retry_transient = retry(
+    retry=retry_if_exception_type(TRANSIENT_ERRORS),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=2, max=30),
+    reraise=True
+)
+
+# Crew memory settings; long-term memory lives in CrewAI's SQLite store
+# under CREWAI_STORAGE_DIR
+EMBEDDER = {
+    "provider": "google",
+    "config": {"model": "models/text-embedding-004", "api_key": GOOGLE_API_KEY}
+}
+
+# Caps the LLM iterations of a single crew run per minute. Tool calls are not
+# counted, and every request's crew copy has its own limiter, so this is not
+# a process-wide or Serper quota.
+CREW_MAX_RPM = 30
+
+# Static part of the simulation-mode response, shared by every fallback
+_SIMULATION_TEMPLATE = {
+    "status": "simulation",
+    "message": "Multi-agent system working in simulation mode",
+    "workflow": [
+        "Writer Agent creates content (Gemini 2.5 Flash + Serper)",
+        "Editor Agent reviews and improves (Gemini 2.5 Flash)",
+        "SEO Agent optimizes for search engines (Gemini 2.5 Flash + Serper)"
+    ],
+    "apis_used": ["Gemini 2.5 Flash API", "Serper API"]
+}
+
+def _render_simulation(topic, audience, content_type, word_count):
+    """Build the simulation-mode response for a request."""
+    return {
+        **_SIMULATION_TEMPLATE,
+        "topic": topic,
+        "audience": audience,
+        "content_type": content_type,
+        "word_count": word_count
+    }
+
+def max_tokens_for(word_count):
+    """Token budget for a "low-high" word count range, or None if it can't be parsed."""
+    try:
+        high = int(str(word_count).split("-")[-1])
+    except ValueError:
+        return None
+    return int(high * TOKENS_PER_WORD)
 
 class ContentCreationTeam:
-    def __init__(self):
-        """Initialize the Content Creation Team with 3 specialized agents."""
-        # Set up Gemini LLM
-        self.llm = LLM(
-            model="gemini/gemini-2.0-flash-exp",
-            api_key=os.environ.get("GOOGLE_API_KEY")
-        )
+    # Process-wide teams built by load(), keyed by verbosity
+    _instances = {}
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def load(cls, verbose=VERBOSE):
+        """
+        Return the shared team for this process, building it on first use.
+        
+        Launchers can call this in the background at startup so the first
+        visitor doesn't pay for constructing the agent graph.
+        """
+        with cls._instances_lock:
+            if verbose not in cls._instances:
+                cls._instances[verbose] = cls(verbose=verbose)
+            return cls._instances[verbose]
+    
+    def __init__(self, verbose=VERBOSE):
+        """
+        Initialize the Content Creation Team with 3 specialized agents.
+        
+        Args:
+            verbose (bool): Stream agent and crew output to stdout
+        """
+        self.verbose = verbose
+        # Set up Gemini LLMs
+        self.writer_llm = LLM(model=WRITER_MODEL, api_key=GOOGLE_API_KEY, temperature=WRITER_TEMPERATURE)
+        self.editor_llm = LLM(model=EDITOR_MODEL, api_key=GOOGLE_API_KEY, temperature=EDITOR_TEMPERATURE)
+        self.seo_llm = LLM(model=SEO_MODEL, api_key=GOOGLE_API_KEY)
         self.setup_agents()
         self.setup_tasks()
         self.setup_crew()
+        self.load_cache()
     
     def setup_agents(self):
         """Create the three specialized agents for content creation."""
@@ -48,10 +240,10 @@ class ContentCreationTeam:
             compelling blog posts, articles, and social media content. You have a talent for making 
             complex topics accessible and engaging for various audiences. You excel at research, 
             storytelling, and adapting your writing style to different brands and purposes.""",
-            verbose=True,
+            verbose=self.verbose,
             allow_delegation=False,
-            llm=self.llm,
-            tools=[SerperDevTool()]
+            llm=self.writer_llm,
+            tools=[_SERPER_TOOL]
         )
         
         # Editor Agent - Content quality reviewer
@@ -62,9 +254,9 @@ class ContentCreationTeam:
             fact-checking, and improving content quality. You have an eye for detail and ensure all 
             content meets high standards for grammar, style, clarity, and factual accuracy. You work 
             with various content types and maintain brand voice consistency.""",
-            verbose=True,
+            verbose=self.verbose,
             allow_delegation=False,
-            llm=self.llm
+            llm=self.editor_llm
         )
         
         # SEO Specialist Agent - Content optimizer
@@ -74,14 +266,20 @@ class ContentCreationTeam:
             backstory="""You are a digital marketing expert specializing in SEO and social media optimization. 
             You have deep knowledge of search algorithms, keyword research, and social media best practices. 
             You excel at making content discoverable while maintaining readability and user experience.""",
-            verbose=True,
+            verbose=self.verbose,
             allow_delegation=False,
-            llm=self.llm,
-            tools=[SerperDevTool()]
+            llm=self.seo_llm,
+            tools=[_SERPER_TOOL]
         )
     
     def setup_tasks(self):
-        """Define the tasks for each agent in the content creation workflow."""
+        """
+        Define the tasks for each agent in the content creation workflow.
+        
+        Request-specific inputs go at the end of each description so the
+        prompt prefix stays identical across runs and can be served from
+        Gemini's implicit prompt cache.
+        """
         
         # Task 1: Content Writing
         self.writing_task = Task(
@@ -92,17 +290,32 @@ class ContentCreationTeam:
             - Tailored to the target audience
             - Original and plagiarism-free
             
+            Provide the complete content with proper formatting.
+            
             Topic: {topic}
             Target Audience: {audience}
             Content Type: {content_type}
-            Word Count: {word_count}
-            
-            Provide the complete content with proper formatting.""",
+            Word Count: {word_count}""",
             agent=self.writer_agent,
             expected_output="A complete, well-structured piece of content ready for editing"
         )
         
-        # Task 2: Content Editing
+        # Task 2: SEO Keyword Research (only needs the topic)
+        self.seo_research_task = Task(
+            description="""Research search keywords for the given topic. Identify:
+            - Primary and secondary keywords with search intent
+            - Related questions people search for
+            - Competing top-ranking titles
+            
+            Provide a concise keyword research brief.
+            
+            Topic: {topic}
+            Target Audience: {audience}""",
+            agent=self.seo_agent,
+            expected_output="A keyword research brief with primary keywords, secondary keywords and related questions"
+        )
+        
+        # Task 3: Content Editing
         self.editing_task = Task(
             description="""Review and edit the content provided by the writer. Focus on:
             - Grammar, spelling, and punctuation
@@ -114,12 +327,13 @@ class ContentCreationTeam:
             
             Provide the edited version with explanations of major changes made.""",
             agent=self.editor_agent,
-            expected_output="A polished, error-free version of the content with editing notes"
+            expected_output="A polished, error-free version of the content with editing notes",
+            context=[self.writing_task]
         )
         
-        # Task 3: SEO Optimization
+        # Task 4: SEO Optimization
         self.seo_task = Task(
-            description="""Optimize the edited content for search engines and social media. Include:
+            description="""Optimize the edited content for search engines and social media using the keyword research. Include:
             - Relevant keywords naturally integrated
             - SEO-friendly title and meta description
             - Social media snippets (Twitter, LinkedIn, Facebook)
@@ -129,20 +343,194 @@ class ContentCreationTeam:
             
             Provide the final optimized content with SEO recommendations.""",
             agent=self.seo_agent,
-            expected_output="SEO-optimized content with social media versions and optimization recommendations"
+            expected_output="SEO-optimized content with social media versions and optimization recommendations",
+            context=[self.editing_task, self.seo_research_task]
         )
     
     def setup_crew(self):
         """Create the crew that orchestrates the workflow between agents."""
         self.crew = Crew(
             agents=[self.writer_agent, self.editor_agent, self.seo_agent],
-            tasks=[self.writing_task, self.editing_task, self.seo_task],
+            tasks=[self.writing_task, self.seo_research_task, self.editing_task, self.seo_task],
             process=Process.sequential,
-            verbose=True,
-            memory=False
+            verbose=self.verbose,
+            memory=True,
+            embedder=EMBEDDER,
+            max_rpm=CREW_MAX_RPM
         )
     
-    def create_content(self, topic, audience="general audience", content_type="blog post", word_count="800-1000"):
+    def clear_memory(self):
+        """Clear the crew's persistent long-term memory."""
+        self.crew.reset_memories("long")
+    
+    def load_cache(self):
+        """Load previously generated results from the on-disk cache."""
+        # Guards the cache for callers sharing this team across threads,
+        # including free-threaded builds where there is no GIL to rely on
+        self._cache_lock = threading.RLock()
+        # Exact-match results keyed by (topic, audience, content_type, word_count)
+        self._exact_cache = {}
+        # Semantic entries as (normalized topic embedding, key, result)
+        self._semantic_cache = []
+        
+        if not CACHE_PATH.exists():
+            return
+        
+        try:
+            entries = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️  Could not read cache: %s", e)
+            return
+        
+        for entry in entries:
+            key = tuple(entry["key"])
+            self._exact_cache[key] = entry["result"]
+            if entry.get("vector"):
+                self._semantic_cache.append((entry["vector"], key, entry["result"]))
+    
+    def save_cache(self):
+        """Persist the cache so warm restarts can reuse earlier results."""
+        with self._cache_lock:
+            vectors = {key: vector for vector, key, _ in self._semantic_cache}
+            entries = [
+                {"key": list(key), "vector": vectors.get(key), "result": result}
+                for key, result in self._exact_cache.items()
+            ]
+            
+            try:
+                CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                CACHE_PATH.write_text(json.dumps(entries), encoding="utf-8")
+            except OSError as e:
+                logger.warning("⚠️  Could not write cache: %s", e)
+    
+    def clear_cache(self):
+        """
+        Drop all cached results, in memory and on disk.
+        
+        The other teams loaded in this process share the cache file, so
+        their in-memory caches are dropped too; otherwise their next
+        store_cache would write the old entries back.
+        """
+        with self._instances_lock:
+            teams = {self, *self._instances.values()}
+        
+        for team in teams:
+            with team._cache_lock:
+                team._exact_cache = {}
+                team._semantic_cache = []
+        
+        with self._cache_lock:
+            CACHE_PATH.unlink(missing_ok=True)
+    
+    def embed_topic(self, topic):
+        """Return a normalized embedding for the topic, or None if unavailable."""
+        try:
+            response = litellm.embedding(
+                model=EMBEDDING_MODEL,
+                input=[topic],
+                api_key=GOOGLE_API_KEY
+            )
+            vector = response.data[0]["embedding"]
+        except Exception as e:
+            logger.warning("⚠️  Embedding unavailable, semantic cache skipped: %s", e)
+            return None
+        
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+    
+    def lookup_cache(self, key, vector):
+        """
+        Find a cached result for the request.
+        
+        Semantic matches only consider entries with the same audience,
+        content type and word count, so a paraphrased topic never returns
+        content of the wrong shape.
+        
+        Returns:
+            tuple: (result, hit_type) or (None, None) on a miss
+        """
+        with self._cache_lock:
+            if key in self._exact_cache:
+                return self._exact_cache[key], "exact"
+            semantic_cache = self._semantic_cache
+        
+        if vector is None:
+            return None, None
+        
+        # clear_cache swaps in a new list and store_cache only appends, so
+        # scanning this reference outside the lock is safe with or without the GIL
+        best_score, best_result = 0.0, None
+        for cached_vector, cached_key, cached_result in semantic_cache:
+            if cached_key[1:] != key[1:]:
+                continue
+            score = sum(a * b for a, b in zip(vector, cached_vector))
+            if score > best_score:
+                best_score, best_result = score, cached_result
+        
+        if best_score > SEMANTIC_THRESHOLD:
+            return best_result, "semantic"
+        return None, None
+    
+    def store_cache(self, key, vector, result):
+        """Remember a generated result and persist the cache."""
+        with self._cache_lock:
+            self._exact_cache[key] = result
+            if vector is not None:
+                self._semantic_cache.append((vector, key, result))
+            self.save_cache()
+    
+    def crew_for(self, word_count, step_callback=None, on_chunk=None):
+        """
+        Copy the crew for a single request.
+        
+        The Writer and SEO agents get LLMs whose max_tokens is bounded by
+        the requested word count, and the optional step_callback is only
+        attached to the copy, so concurrent callers sharing this team never
+        affect each other.
+        
+        With on_chunk, the SEO agent's LLM streams and its chunks are passed
+        to on_chunk once the Editor has finished, so only the final SEO pass
+        is forwarded and not the keyword research that runs before it.
+        """
+        crew = self.crew.copy()
+        max_tokens = max_tokens_for(word_count)
+        
+        for agent in crew.agents:
+            if agent.role == self.writer_agent.role and max_tokens:
+                agent.llm = LLM(model=WRITER_MODEL, api_key=GOOGLE_API_KEY,
+                                temperature=WRITER_TEMPERATURE, max_tokens=max_tokens)
+            elif agent.role == self.seo_agent.role and (max_tokens or on_chunk):
+                agent.llm = LLM(model=SEO_MODEL, api_key=GOOGLE_API_KEY,
+                                max_tokens=max_tokens + SEO_EXTRA_TOKENS if max_tokens else None,
+                                stream=bool(on_chunk))
+                seo_llm = agent.llm
+        
+        if on_chunk:
+            def start_streaming(output):
+                if output.agent == self.editor_agent.role:
+                    _STREAM_SINKS[id(seo_llm)] = on_chunk
+            crew.task_callback = start_streaming
+        
+        if step_callback:
+            crew.step_callback = step_callback
+        return crew
+    
+    @_retry_transient
+    def kickoff(self, inputs, step_callback=None, on_chunk=None):
+        """Run the crew, retrying transient provider errors with exponential backoff."""
+        crew = self.crew_for(inputs["word_count"], step_callback, on_chunk)
+        try:
+            return crew.kickoff(inputs=inputs)
+        finally:
+            for agent in crew.agents:
+                _STREAM_SINKS.pop(id(agent.llm), None)
+    
+    @_retry_transient
+    async def kickoff_async(self, inputs):
+        """Run the crew asynchronously, retrying transient provider errors like kickoff."""
+        return await self.crew_for(inputs["word_count"]).kickoff_async(inputs=inputs)
+    
+    def create_content(self, topic, audience="general audience", content_type="blog post", word_count="800-1000", use_cache=True, on_step=None, on_chunk=None):
         """
         Execute the content creation workflow.
         
@@ -151,39 +539,63 @@ class ContentCreationTeam:
             audience (str): Target audience for the content
             content_type (str): Type of content (blog post, article, etc.)
             word_count (str): Desired word count range
+            use_cache (bool): Reuse results for identical or similar requests
+            on_step (callable): Called with each intermediate agent step
+            on_chunk (callable): Called with each text chunk of the final
+                SEO pass as it is generated; cached results are not streamed
         
         Returns:
             dict: Results from the content creation process
         """
-        print(f"🚀 Starting Content Creation Team workflow...")
-        print(f"📝 Topic: {topic}")
-        print(f"👥 Audience: {audience}")
-        print(f"📄 Type: {content_type}")
-        print(f"📊 Word Count: {word_count}")
-        print("-" * 50)
-        
-        # Update task descriptions with the input parameters
-        self.writing_task.description = self.writing_task.description.format(
-            topic=topic,
-            audience=audience,
-            content_type=content_type,
-            word_count=word_count
-        )
+        logger.info("🚀 Starting Content Creation Team workflow...")
+        logger.info("📝 Topic: %s", topic)
+        logger.info("👥 Audience: %s", audience)
+        logger.info("📄 Type: %s", content_type)
+        logger.info("📊 Word Count: %s", word_count)
+        
+        cache_key = (topic, audience, content_type, word_count)
+        vector = None
+        if use_cache:
+            cached, hit_type = self.lookup_cache(cache_key, None)
+            if cached is None:
+                vector = self.embed_topic(topic)
+                cached, hit_type = self.lookup_cache(cache_key, vector)
+            
+            if cached is not None:
+                logger.info("⚡ Cache hit (%s) - skipping multi-agent workflow", hit_type)
+                return {
+                    "status": "success",
+                    "message": "Content served from cache!",
+                    "result": cached,
+                    "cache": hit_type,
+                    "apis_used": [],
+                    "topic": topic,
+                    "audience": audience,
+                    "content_type": content_type,
+                    "word_count": word_count
+                }
         
-        print("🎯 Using APIs:")
-        print("   ✅ Gemini 2.5 Flash API (Google)")
-        print("   ✅ Serper API (Web Search)")
-        print("-" * 50)
+        logger.info("🎯 Using APIs:")
+        logger.info("   ✅ Gemini 2.5 Flash API (Google)")
+        logger.info("   ✅ Serper API (Web Search)")
         
         try:
             # Execute the crew workflow
-            print("🤖 Starting Multi-Agent Workflow...")
-            result = self.crew.kickoff()
+            logger.info("🤖 Starting Multi-Agent Workflow...")
+            # CrewAI interpolates the inputs into the task templates per run,
+            # so the placeholders in the task descriptions stay intact
+            result = str(self.kickoff(inputs={
+                "topic": topic,
+                "audience": audience,
+                "content_type": content_type,
+                "word_count": word_count
+            }, step_callback=on_step, on_chunk=on_chunk))
             
-            print("\n✅ Content Creation Team Complete!")
-            print("=" * 60)
-            print("📋 Final Result:")
-            print(result)
+            logger.info("✅ Content Creation Team Complete!")
+            logger.info("📋 Final Result:\n%s", result)
+            
+            if use_cache:
+                self.store_cache(cache_key, vector, result)
             
             return {
                 "status": "success",
@@ -197,56 +609,71 @@ class ContentCreationTeam:
             }
             
         except Exception as e:
-            print(f"⚠️  API Error: {e}")
-            print("\n🔄 Falling back to simulation mode...")
-            
-            # Fallback to simulation if API fails
-            print("🎯 Multi-Agent System Working (Simulation Mode)!")
-            print("=" * 60)
-            
-            print("🤖 Agent 1: Content Writer")
-            print("   ✅ Researching topic: " + topic)
-            print("   ✅ Creating engaging content for: " + audience)
-            print("   ✅ Structuring content as: " + content_type)
-            print("   ✅ Targeting word count: " + word_count)
-            print("   🔍 Using Serper API for research")
-            print("   📝 Using Gemini 2.5 Flash for content generation")
-            print()
-            
-            print("🤖 Agent 2: Content Editor")
-            print("   ✅ Reviewing content quality")
-            print("   ✅ Checking grammar and style")
-            print("   ✅ Ensuring brand consistency")
-            print("   ✅ Improving readability")
-            print("   🧠 Using Gemini 2.5 Flash for editing")
-            print()
+            logger.warning("⚠️  API Error: %s - falling back to simulation mode", e)
+            return _render_simulation(topic, audience, content_type, word_count)
+    
+    async def create_content_batch(self, jobs, on_progress=None, use_cache=True):
+        """
+        Execute the content creation workflow for several topics concurrently.
+        
+        Each job runs on its own copy of the crew (see crew_for), so the
+        shared task templates are never interpolated by two runs at once.
+        
+        Args:
+            jobs (list): Dicts with a "topic" and optional "audience",
+                "content_type" and "word_count" keys
+            on_progress (callable): Called as on_progress(done, total)
+                after each job finishes
+            use_cache (bool): Reuse and store results for identical requests
+        
+        Returns:
+            list: One result dict per job, in the order of jobs
+        """
+        inputs_list = [
+            {
+                "topic": job["topic"],
+                "audience": job.get("audience", "general audience"),
+                "content_type": job.get("content_type", "blog post"),
+                "word_count": job.get("word_count", "800-1000")
+            }
+            for job in jobs
+        ]
+        total = len(inputs_list)
+        done = 0
+        
+        logger.info("🚀 Starting batch workflow for %s topics...", total)
+        
+        async def run(inputs):
+            nonlocal done
+            key = tuple(inputs.values())
+            cached = self.lookup_cache(key, None)[0] if use_cache else None
             
-            print("🤖 Agent 3: SEO Specialist")
-            print("   ✅ Optimizing for search engines")
-            print("   ✅ Adding relevant keywords")
-            print("   ✅ Creating social media snippets")
-            print("   ✅ Improving content visibility")
-            print("   🔍 Using Serper API for SEO research")
-            print("   📝 Using Gemini 2.5 Flash for optimization")
-            print()
+            if cached is not None:
+                response = {"status": "success", "message": "Content served from cache!",
+                            "result": cached, "cache": "exact", **inputs}
+            else:
+                try:
+                    result = str(await self.kickoff_async(inputs))
+                    if use_cache:
+                        self.store_cache(key, None, result)
+                    response = {"status": "success", "message": "Content created successfully!",
+                                "result": result, **inputs}
+                except Exception as e:
+                    logger.warning("⚠️  API Error for '%s': %s", inputs['topic'], e)
+                    response = {"status": "error", "message": str(e), **inputs}
             
-            return {
-                "status": "simulation",
-                "message": "Multi-agent system working in simulation mode",
-                "workflow": [
-                    "Writer Agent creates content (Gemini 2.5 Flash + Serper)",
-                    "Editor Agent reviews and improves (Gemini 2.5 Flash)",
-                    "SEO Agent optimizes for search engines (Gemini 2.5 Flash + Serper)"
-                ],
-                "topic": topic,
-                "audience": audience,
-                "content_type": content_type,
-                "word_count": word_count,
-                "apis_used": ["Gemini 2.5 Flash API", "Serper API"]
-            }
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+            return response
+        
+        return await asyncio.gather(*(run(inputs) for inputs in inputs_list))
 
 def main():
     """Main function to demonstrate the Content Creation Team."""
+    # force=True: importing CrewAI has already configured the root logger
+    logging.basicConfig(level=logging.INFO, format="%(message)s", force=True)
+    
     print("🎯 Content Creation Team - Multi-Agent System")
     print("=" * 60)
     print("🔧 Using: Gemini 2.5 Flash + Serper APIs")
@@ -6,11 +6,17 @@ Launch script for the AI Content Creation Studio
 This script launches the new Streamlit application with proper configuration.
 """
 
-import subprocess
 import sys
-import os
+import threading
 from pathlib import Path
 
+from streamlit.web import bootstrap
+
+def warm_start():
+    """Import the content team and build the shared instance ahead of the first request."""
+    from content_creation_team import ContentCreationTeam
+    ContentCreationTeam.load()
+
 def main():
     """Launch the Streamlit application."""
     
@@ -23,15 +29,6 @@ def main():
         print("Please run this script from the project directory.")
         sys.exit(1)
     
-    # Check if virtual environment exists
-    if not Path("venv").exists():
-        print("❌ Error: Virtual environment not found!")
-        print("Please create a virtual environment first:")
-        print("python -m venv venv")
-        print("source venv/bin/activate")
-        print("pip install -r requirements_new.txt")
-        sys.exit(1)
-    
     # Launch Streamlit
     try:
         print("🌐 Launching Streamlit application...")
@@ -39,11 +36,13 @@ def main():
         print("🛑 Press Ctrl+C to stop the application")
         print("=" * 50)
         
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "new_streamlit_app.py",
-            "--server.headless", "true",
-            "--server.port", "8501"
-        ])
+        # Build the agent team while the server starts, so it's ready for the first visitor
+        threading.Thread(target=warm_start, daemon=True).start()
+        
+        # Run Streamlit in this interpreter instead of spawning a second one
+        flag_options = {"server.headless": True, "server.port": 8501}
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run("new_streamlit_app.py", is_hello=False, args=[], flag_options=flag_options)
         
     except KeyboardInterrupt:
         print("\n🛑 Application stopped by user")
@@ -8,16 +8,28 @@ Features real-time content generation, progress tracking, and comprehensive outp
 """
 
 import streamlit as st
+import asyncio
+import logging
 import os
+import queue
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
-from content_creation_team import ContentCreationTeam
+from content_creation_team import ContentCreationTeam, VERBOSE
 
 # Load environment variables
 load_dotenv()
 
+# Only warnings by default; the sidebar "Verbose" toggle enables INFO logs
+TEAM_LOGGER = logging.getLogger("content_creation_team")
+if not TEAM_LOGGER.handlers:
+    # Own handler, since importing CrewAI already configures the root logger
+    TEAM_LOGGER.addHandler(logging.StreamHandler())
+    TEAM_LOGGER.propagate = False
+    TEAM_LOGGER.setLevel(logging.WARNING)
+
 # Page configuration
 st.set_page_config(
     page_title="AI Content Creation Studio",
@@ -26,8 +38,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Form options
+CONTENT_TYPES = ("blog post", "article", "report", "whitepaper", "social media post", "email newsletter")
+RESEARCH_DEPTHS = ("Basic", "Comprehensive", "In-depth")
+TONES = ("Professional", "Casual", "Academic", "Conversational")
+SEO_LEVELS = ("Low", "Medium", "High")
+
+# Static page content, built once and reused on every rerun
+@st.cache_data
+def _css():
+    """Custom CSS for better styling."""
+    return """
 <style>
     .main-header {
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -64,18 +85,54 @@ st.markdown("""
         text-align: center;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def main():
-    """Main application function."""
-    
-    # Header
-    st.markdown("""
+@st.cache_data
+def _header_html():
+    """Header banner markup."""
+    return """
     <div class="main-header">
         <h1>🚀 AI Content Creation Studio</h1>
         <p>Multi-Agent AI System for Professional Content Creation</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+@st.cache_data
+def _agents_markdown():
+    """Sidebar description of the AI agents."""
+    return """
+        **Writer Agent**
+        - Creates engaging content
+        - Researches topics
+        - Structures information
+        
+        **Editor Agent**
+        - Reviews quality
+        - Improves readability
+        - Ensures consistency
+        
+        **SEO Agent**
+        - Optimizes for search
+        - Adds keywords
+        - Creates social snippets
+        """
+
+@st.cache_data(ttl=3600)
+def _api_status():
+    """Return whether the Gemini and Serper API keys are configured."""
+    return bool(os.getenv("GOOGLE_API_KEY")), bool(os.getenv("SERPER_API_KEY"))
+
+@st.cache_resource
+def get_team(verbose=VERBOSE):
+    """Build the content creation team once per verbosity and share it across reruns."""
+    return ContentCreationTeam.load(verbose=verbose)
+
+def main():
+    """Main application function."""
+    
+    # Styling and header
+    st.markdown(_css(), unsafe_allow_html=True)
+    st.markdown(_header_html(), unsafe_allow_html=True)
     
     # Sidebar for configuration
     with st.sidebar:
@@ -83,8 +140,7 @@ def main():
         
         # API Status
         st.subheader("🔑 API Status")
-        google_api = os.getenv("GOOGLE_API_KEY")
-        serper_api = os.getenv("SERPER_API_KEY")
+        google_api, serper_api = _api_status()
         
         if google_api and serper_api:
             st.success("✅ All APIs Configured")
@@ -101,24 +157,13 @@ def main():
         with col2:
             st.metric("Serper API", "✅ Active" if serper_api else "❌ Inactive")
         
+        # Logging
+        verbose = st.toggle("🔊 Verbose", value=VERBOSE, key="verbose", help="Log agent workflow details to the console")
+        TEAM_LOGGER.setLevel(logging.INFO if verbose else logging.WARNING)
+        
         # Agent Information
         st.subheader("🤖 AI Agents")
-        st.markdown("""
-        **Writer Agent**
-        - Creates engaging content
-        - Researches topics
-        - Structures information
-        
-        **Editor Agent**
-        - Reviews quality
-        - Improves readability
-        - Ensures consistency
-        
-        **SEO Agent**
-        - Optimizes for search
-        - Adds keywords
-        - Creates social snippets
-        """)
+        st.markdown(_agents_markdown())
         
         # Quick Actions
         st.subheader("🎯 Quick Actions")
@@ -127,6 +172,14 @@ def main():
         
         if st.button("📊 View Statistics", help="View system statistics"):
             show_statistics()
+        
+        if st.button("🗑️ Clear Cache", help="Forget previously generated content"):
+            get_team(st.session_state.verbose).clear_cache()
+            st.success("✅ Content cache cleared")
+        
+        if st.button("🧠 Clear Memory", help="Forget what the agents learned in earlier runs"):
+            get_team(st.session_state.verbose).clear_memory()
+            st.success("✅ Agent memory cleared")
     
     # Main content area
     st.header("📝 Content Creation Studio")
@@ -153,7 +206,7 @@ def main():
         with col2:
             content_type = st.selectbox(
                 "📄 Content Type",
-                ["blog post", "article", "report", "whitepaper", "social media post", "email newsletter"],
+                CONTENT_TYPES,
                 help="What type of content do you want to create?"
             )
             
@@ -173,21 +226,21 @@ def main():
             with col1:
                 research_depth = st.selectbox(
                     "Research Depth",
-                    ["Basic", "Comprehensive", "In-depth"],
+                    RESEARCH_DEPTHS,
                     index=1
                 )
             
             with col2:
                 tone = st.selectbox(
                     "Content Tone",
-                    ["Professional", "Casual", "Academic", "Conversational"],
+                    TONES,
                     index=0
                 )
             
             with col3:
                 seo_focus = st.selectbox(
                     "SEO Focus",
-                    ["Low", "Medium", "High"],
+                    SEO_LEVELS,
                     index=1
                 )
         
@@ -213,13 +266,14 @@ def main():
             status_text.text("🤖 Initializing AI agents...")
             progress_bar.progress(10)
             
-            team = ContentCreationTeam()
+            team = get_team(st.session_state.verbose)
             
             # Generate content
             status_text.text("📝 Creating content...")
             progress_bar.progress(30)
             
-            result = team.create_content(
+            result = run_with_live_steps(
+                team,
                 topic=topic,
                 audience=audience,
                 content_type=content_type,
@@ -242,6 +296,9 @@ def main():
             # Show simulation mode
             show_simulation_mode(topic, audience, content_type, word_count)
     
+    # Batch generation
+    show_batch_generation(google_api and serper_api)
+    
     # Footer
     st.markdown("---")
     st.markdown("### 🚀 Deploy Your Own Instance")
@@ -267,6 +324,93 @@ def main():
     st.markdown("---")
     st.caption("Powered by CrewAI, Gemini 2.5 Flash, and Serper API")
 
+def run_with_live_steps(team, **request):
+    """Run create_content in a worker thread while streaming agent steps to the page."""
+    steps = queue.Queue()
+    activity = st.expander("🧠 Agent Activity", expanded=True)
+    placeholder = activity.empty()
+    log = []
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(team.create_content, on_step=steps.put, **request)
+        
+        while not future.done() or not steps.empty():
+            try:
+                step = steps.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            log.append(str(getattr(step, "text", None) or step))
+            placeholder.markdown("\n\n---\n\n".join(log))
+        
+        return future.result()
+
+def show_batch_generation(apis_configured):
+    """Generate content for several topics at once."""
+    st.markdown("---")
+    st.header("📚 Batch Content Creation")
+    
+    with st.form("batch_form"):
+        topics_text = st.text_area(
+            "📌 Topics",
+            placeholder="One topic per line",
+            help="Each line is generated as a separate piece of content"
+        )
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            audience = st.text_input("👥 Target Audience", value="general audience")
+        
+        with col2:
+            content_type = st.selectbox(
+                "📄 Content Type",
+                CONTENT_TYPES
+            )
+        
+        with col3:
+            word_count = st.slider("📊 Word Count", min_value=300, max_value=3000, value=1000, step=100)
+        
+        submitted = st.form_submit_button("🚀 Generate Batch", use_container_width=True)
+    
+    if not submitted:
+        return
+    
+    if not apis_configured:
+        st.error("❌ API keys not configured. Please check your .env file.")
+        return
+    
+    topics = [line.strip() for line in topics_text.splitlines() if line.strip()]
+    if not topics:
+        st.warning("⚠️ Please enter at least one topic")
+        return
+    
+    jobs = [
+        {
+            "topic": topic,
+            "audience": audience,
+            "content_type": content_type,
+            "word_count": f"{word_count-200}-{word_count+200}"
+        }
+        for topic in topics
+    ]
+    
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    
+    def on_progress(done, total):
+        progress_bar.progress(done / total)
+        status_text.text(f"📝 {done}/{total} pieces complete")
+    
+    results = asyncio.run(get_team(st.session_state.verbose).create_content_batch(jobs, on_progress=on_progress))
+    status_text.text("✅ Batch generation complete!")
+    
+    for result in results:
+        with st.expander(f"📄 {result['topic']}"):
+            if result.get("status") == "success":
+                st.markdown(result["result"])
+            else:
+                st.error(f"❌ Error: {result.get('message')}")
+
 def display_results(result, topic, audience, content_type, word_count):
     """Display the content generation results."""
     
@@ -302,6 +446,34 @@ def display_results(result, topic, audience, content_type, word_count):
         st.warning("⚠️ Content created in simulation mode")
         show_simulation_mode(topic, audience, content_type, word_count)
 
+@st.cache_data(max_entries=128)
+def _simulated_content(topic, audience, content_type, word_count):
+    """Render the simulated content markdown for a request."""
+    return f"""
+# {topic}
+
+## Introduction
+
+This is a simulated content piece about {topic}, designed for {audience}. 
+The content would be structured as a {content_type} with approximately {word_count} words.
+
+## Key Points
+
+- **Point 1**: AI is transforming healthcare through advanced diagnostics
+- **Point 2**: Personalized treatment plans are becoming more accessible
+- **Point 3**: Remote monitoring and telemedicine are expanding care access
+- **Point 4**: Data-driven insights are improving patient outcomes
+
+## Conclusion
+
+The future of healthcare is being shaped by artificial intelligence, offering 
+unprecedented opportunities for {audience} to improve patient care and outcomes.
+
+---
+
+*This is simulated content. For real content generation, ensure your API keys are properly configured.*
+    """
+
 def show_simulation_mode(topic, audience, content_type, word_count):
     """Show simulation mode when APIs are not available."""
     
@@ -331,30 +503,7 @@ def show_simulation_mode(topic, audience, content_type, word_count):
     
     # Simulated content
     st.markdown("### 📄 Simulated Content")
-    simulated_content = f"""
-# {topic}
-
-## Introduction
-
-This is a simulated content piece about {topic}, designed for {audience}. 
-The content would be structured as a {content_type} with approximately {word_count} words.
-
-## Key Points
-
-- **Point 1**: AI is transforming healthcare through advanced diagnostics
-- **Point 2**: Personalized treatment plans are becoming more accessible
-- **Point 3**: Remote monitoring and telemedicine are expanding care access
-- **Point 4**: Data-driven insights are improving patient outcomes
-
-## Conclusion
-
-The future of healthcare is being shaped by artificial intelligence, offering 
-unprecedented opportunities for {audience} to improve patient care and outcomes.
-
----
-
-*This is simulated content. For real content generation, ensure your API keys are properly configured.*
-    """
+    simulated_content = _simulated_content(topic, audience, content_type, word_count)
     
     st.markdown(simulated_content)
     
@@ -370,12 +519,13 @@ def test_system():
     """Test the multi-agent system."""
     with st.spinner("Testing system..."):
         try:
-            team = ContentCreationTeam()
+            team = get_team(st.session_state.verbose)
             result = team.create_content(
                 topic="Test Topic",
                 audience="test audience",
                 content_type="blog post",
-                word_count="500-600"
+                word_count="500-600",
+                use_cache=False
             )
             
             if result.get("status") == "success":
@@ -8,24 +8,48 @@ Outputs plain text content without HTML formatting.
 """
 
 import streamlit as st
+import asyncio
+import functools
 import os
+import hashlib
+import json
+import logging
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dotenv import load_dotenv
-from content_creation_team import ContentCreationTeam
-
-# Load environment variables
-load_dotenv()
-
-# For Streamlit Cloud deployment, also check secrets
-try:
-    import streamlit as st
-    # Check if running on Streamlit Cloud
-    if hasattr(st, 'secrets') and st.secrets:
-        # Use secrets from Streamlit Cloud
-        os.environ["GOOGLE_API_KEY"] = st.secrets.get("GOOGLE_API_KEY", os.getenv("GOOGLE_API_KEY"))
-        os.environ["SERPER_API_KEY"] = st.secrets.get("SERPER_API_KEY", os.getenv("SERPER_API_KEY"))
-except:
-    pass
+from pathlib import Path
+
+import diskcache
+from selectolax.lexbor import LexborHTMLParser
+from streamlit.errors import StreamlitSecretNotFoundError
+
+logger = logging.getLogger(__name__)
+
+@st.cache_resource(show_spinner=False)
+def _load_api_keys():
+    """
+    Resolve the API keys once per process, preferring Streamlit Cloud secrets.
+    
+    Returns:
+        tuple: (GOOGLE_API_KEY, SERPER_API_KEY), None where unset
+    """
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
+    
+    try:
+        secrets = dict(st.secrets)
+    except (FileNotFoundError, StreamlitSecretNotFoundError):
+        secrets = {}
+    
+    for name in ("GOOGLE_API_KEY", "SERPER_API_KEY"):
+        value = secrets.get(name) or os.getenv(name)
+        if value:
+            os.environ[name] = value
+    return os.getenv("GOOGLE_API_KEY"), os.getenv("SERPER_API_KEY")
 
 # Page configuration
 st.set_page_config(
@@ -34,9 +58,271 @@ st.set_page_config(
     layout="wide"
 )
 
+# Form options
+CONTENT_TYPES = ("blog post", "article", "report", "whitepaper")
+WORD_COUNT_MIN, WORD_COUNT_MAX, WORD_COUNT_DEFAULT, WORD_COUNT_STEP = 300, 3000, 1000, 100
+MAX_DRAFTS = 4
+
+# Leading characters checked for an HTML document marker
+HTML_PROBE_CHARS = 256
+
+# Generated results are reused for identical requests for a day
+RESULT_CACHE_TTL = 86400
+
+@st.cache_resource
+def get_result_cache():
+    """Disk-backed cache of generated results, shared across sessions."""
+    return diskcache.Cache(".content_cache")
+
+# Paraphrased topics reuse a cached result of the same shape above this cosine similarity
+SEMANTIC_INDEX_PATH = Path(".semantic_keys.faiss")
+SEMANTIC_RESULTS_PATH = Path(".semantic_keys.pkl")
+SEMANTIC_THRESHOLD = 0.92
+SEMANTIC_CANDIDATES = 32
+EMBEDDING_DIM = 384
+
+# New semantic entries are written to disk in batches, at most this far apart
+SEMANTIC_SAVE_EVERY = 10
+SEMANTIC_SAVE_INTERVAL = 60
+
+class SemanticCache:
+    """
+    Results indexed by normalized topic embeddings.
+    
+    Embeddings live in a FAISS inner-product index written with
+    faiss.write_index, and (shape, result-cache key) pairs in a pickled list
+    whose positions match the index ids. The shape is the request's
+    (audience, content_type, word_range), and only entries of the same shape
+    match, so a paraphrased topic never returns content of the wrong length
+    or type. Results themselves stay in the result cache, so they expire
+    with RESULT_CACHE_TTL there.
+    
+    The instance is shared by every session's script thread, so the index
+    and list are only touched under a lock that keeps them in step; this
+    does not rely on the GIL, so it also holds on free-threaded (3.13t)
+    builds.
+    """
+    
+    def __init__(self, index_path, results_path):
+        import faiss
+        
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.index_path = index_path
+        self.results_path = results_path
+        self.index = faiss.IndexFlatIP(EMBEDDING_DIM)
+        self.results = []
+        self.unsaved = 0
+        self.saved_at = time.monotonic()
+        self.saved_count = 0
+        
+        if not (index_path.exists() and results_path.exists()):
+            return
+        
+        try:
+            index = faiss.read_index(str(index_path))
+            with results_path.open("rb") as f:
+                results = pickle.load(f)
+        except (OSError, RuntimeError, EOFError, pickle.UnpicklingError) as e:
+            logger.warning("⚠️  Could not read semantic cache, starting empty: %s", e)
+            return
+        
+        # The two files are replaced one after the other, so an interrupted
+        # save can leave them out of step
+        if index.ntotal != len(results):
+            logger.warning("⚠️  Semantic cache files disagree, starting empty")
+            return
+        
+        self.index, self.results = index, results
+        self.saved_count = len(results)
+    
+    def lookup(self, query, shape):
+        """Return the result-cache keys of similar topics with the same shape, most similar first."""
+        with self.lock:
+            if not self.results:
+                return []
+            
+            keys = []
+            scores, ids = self.index.search(query, min(SEMANTIC_CANDIDATES, len(self.results)))
+            for score, i in zip(scores[0], ids[0]):
+                if i < 0 or score <= SEMANTIC_THRESHOLD:
+                    break
+                cached_shape, key = self.results[i]
+                if cached_shape == shape:
+                    keys.append(key)
+            return keys
+    
+    def add(self, query, shape, key):
+        """
+        Remember a result-cache key for the topic embedding and shape.
+        
+        The cache is persisted every SEMANTIC_SAVE_EVERY entries or
+        SEMANTIC_SAVE_INTERVAL seconds, from a snapshot taken under the lock
+        and written outside it, so lookups don't wait on the disk.
+        """
+        import faiss
+        
+        with self.lock:
+            self.index.add(query)
+            self.results.append((shape, key))
+            self.unsaved += 1
+            if self.unsaved < SEMANTIC_SAVE_EVERY and time.monotonic() - self.saved_at < SEMANTIC_SAVE_INTERVAL:
+                return
+            
+            index_bytes = faiss.serialize_index(self.index)
+            results = list(self.results)
+            self.unsaved = 0
+            self.saved_at = time.monotonic()
+        
+        self.save(index_bytes, results)
+    
+    def save(self, index_bytes, results):
+        """Atomically replace the cache files with a snapshot, unless a newer one was already saved."""
+        with self.save_lock:
+            if len(results) <= self.saved_count:
+                return
+            
+            index_tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+            results_tmp = self.results_path.with_name(self.results_path.name + ".tmp")
+            try:
+                index_tmp.write_bytes(index_bytes.tobytes())
+                with results_tmp.open("wb") as f:
+                    pickle.dump(results, f)
+                os.replace(index_tmp, self.index_path)
+                os.replace(results_tmp, self.results_path)
+            except OSError as e:
+                logger.warning("⚠️  Could not write semantic cache: %s", e)
+                return
+            self.saved_count = len(results)
+
+@st.cache_resource
+def get_embedder():
+    """Local sentence embedding model, loaded once per process."""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+@st.cache_resource
+def get_semantic_cache():
+    """Semantic result cache shared across sessions; FAISS is imported on first use."""
+    return SemanticCache(SEMANTIC_INDEX_PATH, SEMANTIC_RESULTS_PATH)
+
+def _embed_topic(topic):
+    """Normalized embedding of a topic, shaped (1, 384), or None if unavailable."""
+    try:
+        return get_embedder().encode([topic], normalize_embeddings=True)
+    except Exception as e:
+        logger.warning("⚠️  Embedding unavailable, semantic cache skipped: %s", e)
+        return None
+
+def _cache_key(topic, audience, content_type, word_count):
+    """Stable cache key for a content request."""
+    payload = {
+        "topic": topic,
+        "audience": audience,
+        "content_type": content_type,
+        "word_count": word_count
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+@st.cache_resource
+def get_executor():
+    """Worker threads for content generation, shared across sessions."""
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Single worker for prefetching, so it never competes with user requests for threads."""
+    return ThreadPoolExecutor(max_workers=1)
+
+@st.cache_resource
+def get_team():
+    """
+    Build the content creation team once per process and share it across sessions.
+    
+    CrewAI and the team module are imported here rather than at the top, so
+    the page renders before they load. The keys are resolved first, since
+    the team module reads them once at import time.
+    """
+    _load_api_keys()
+    from content_creation_team import ContentCreationTeam
+    return ContentCreationTeam.load()
+
+def generate_content(team, specs, chunks):
+    """
+    Run the content creation team for one or more requests; called on a worker thread.
+    
+    A single request streams its final SEO pass into chunks, so the page can
+    show the content while it is being written. Several drafts go through
+    the team's batch entry point as a single call, sharing its LLM
+    connections instead of one call per draft. Every run works on its own
+    copy of the crew, so the shared team is safe to use from several threads.
+    The team's own result cache is bypassed, since the app's caches have
+    already missed by the time this runs.
+    """
+    if len(specs) == 1:
+        return [team.create_content(**specs[0], use_cache=False, on_chunk=chunks.append)]
+    return asyncio.run(team.create_content_batch(specs, use_cache=False))
+
+@st.cache_resource
+def get_inflight():
+    """Generations still running, keyed by their cache keys and shared across sessions, with their lock."""
+    return {}, threading.RLock()
+
+def submit_generation(jobs):
+    """
+    Start generating the cache misses in jobs in the background.
+    
+    Identical requests submitted while a generation is still running, from
+    a double click or another tab, join it instead of starting a second run.
+    
+    Returns:
+        tuple: (future, chunks) of the shared generation
+    """
+    misses = [job for job in jobs if job["result"] is None]
+    key = tuple(job["key"] for job in misses)
+    # Built before taking the lock; the first call imports CrewAI and takes seconds
+    team = get_team()
+    return submit_once(key, get_executor(), generate_content, team, [job["spec"] for job in misses], preempt=True)
+
+def submit_once(key, executor, fn, *args, preempt=False):
+    """
+    Submit fn(*args, chunks) to executor unless a run with the same key is in flight.
+    
+    With preempt, a matching run still queued on another executor (a
+    prefetch waiting behind earlier prefetches) is cancelled and submitted
+    here instead, rather than waiting on it.
+    
+    Returns:
+        tuple: (future, chunks) of the new or already running generation
+    """
+    inflight, lock = get_inflight()
+    with lock:
+        entry = inflight.get(key)
+        if entry is not None and preempt and entry[2] is not executor and entry[0].cancel():
+            entry = None
+        
+        if entry is None:
+            chunks = []
+            future = executor.submit(fn, *args, chunks)
+            entry = inflight[key] = (future, chunks, executor)
+            
+            def release(_, entry=entry):
+                # A cancelled run may already have been replaced under this key;
+                # cancel() calls this while the lock is held, hence the RLock
+                with lock:
+                    if inflight.get(key) is entry:
+                        del inflight[key]
+            future.add_done_callback(release)
+        return entry[:2]
+
 def main():
     """Main application function."""
     
+    # Whether both API keys are set, resolved once per session
+    if "_api_ok" not in st.session_state:
+        st.session_state["_api_ok"] = all(_load_api_keys())
+    api_ok = st.session_state["_api_ok"]
+    
     # Header
     st.title("🤖 AI Content Creator")
     st.markdown("Multi-Agent AI System for Professional Content Creation")
@@ -47,10 +333,7 @@ def main():
         st.header("⚙️ Configuration")
         
         # API Status
-        google_api = os.getenv("GOOGLE_API_KEY")
-        serper_api = os.getenv("SERPER_API_KEY")
-        
-        if google_api and serper_api:
+        if api_ok:
             st.success("✅ APIs Configured")
         else:
             st.error("❌ API Keys Missing")
@@ -60,6 +343,16 @@ def main():
         st.markdown("- **Writer**: Creates content")
         st.markdown("- **Editor**: Reviews quality") 
         st.markdown("- **SEO**: Optimizes content")
+        
+        st.markdown("---")
+        prefetch = st.toggle(
+            "🔮 Prefetch related variants",
+            value=False,
+            help="After each generation, create the other content types for the same topic in the background. Uses extra API calls."
+        )
+        
+        # Filled in after this run's lookups have updated the counters
+        stats_slot = st.empty()
     
     # Main content form
     st.header("📝 Create Content")
@@ -83,110 +376,291 @@ def main():
         with col2:
             content_type = st.selectbox(
                 "📄 Content Type",
-                ["blog post", "article", "report", "whitepaper"],
+                CONTENT_TYPES,
                 help="What type of content?"
             )
             
             word_count = st.slider(
                 "📊 Word Count",
-                min_value=300,
-                max_value=3000, 
-                value=1000,
-                step=100,
+                min_value=WORD_COUNT_MIN,
+                max_value=WORD_COUNT_MAX,
+                value=WORD_COUNT_DEFAULT,
+                step=WORD_COUNT_STEP,
                 help="Desired word count"
             )
         
+        # Drafts
+        drafts = st.slider(
+            "📑 Drafts",
+            min_value=1,
+            max_value=MAX_DRAFTS,
+            value=1,
+            help="Generate several drafts at different lengths in parallel"
+        )
+        
         # Submit button
         submitted = st.form_submit_button(
             "🚀 Generate Content",
             use_container_width=True,
-            type="primary"
+            type="primary",
+            disabled=not api_ok
         )
     
+    if not api_ok:
+        st.error("❌ API keys not configured. Please check your .env file.")
+    
     # Process content generation
     if submitted:
-        if not google_api or not serper_api:
-            st.error("❌ API keys not configured. Please check your .env file.")
-            return
+        # A new submission replaces any generation this session was still waiting on
+        st.session_state.pop("pending", None)
         
-        # Show progress
-        with st.spinner("🤖 AI agents are working..."):
-            try:
-                # Initialize and run content creation
-                team = ContentCreationTeam()
-                result = team.create_content(
-                    topic=topic,
-                    audience=audience,
-                    content_type=content_type,
-                    word_count=f"{word_count-200}-{word_count+200}"
-                )
-                
-                # Display results
-                if result.get("status") == "success":
-                    st.success("✅ Content created successfully!")
-                    
-                    # Show content metadata
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("Topic", topic)
-                    with col2:
-                        st.metric("Audience", audience)
-                    with col3:
-                        st.metric("Type", content_type)
-                    with col4:
-                        st.metric("Word Count", word_count)
-                    
-                    # Display the content
-                    st.subheader("📄 Generated Content")
-                    
-                    # Extract just the content text (remove HTML if present)
-                    content = result.get("result", "")
-                    
-                    # If content contains HTML, extract just the text
-                    if "<!DOCTYPE html>" in content or "<html>" in content:
-                        # Extract content between <body> tags
-                        import re
-                        body_match = re.search(r'<body>(.*?)</body>', content, re.DOTALL)
-                        if body_match:
-                            body_content = body_match.group(1)
-                            # Remove HTML tags but keep the text
-                            import re
-                            clean_content = re.sub(r'<[^>]+>', '', body_content)
-                            st.markdown(clean_content)
-                        else:
-                            st.markdown(content)
-                    else:
-                        st.markdown(content)
-                    
-                    # Download button
-                    st.download_button(
-                        label="📥 Download Content",
-                        data=content,
-                        file_name=f"content_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                        mime="text/plain"
-                    )
-                    
-                else:
-                    st.warning("⚠️ Content created in simulation mode")
-                    show_simulation_content(topic, audience, content_type, word_count)
-                    
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
-                st.info("💡 The system will fall back to simulation mode if APIs are overloaded.")
-                show_simulation_content(topic, audience, content_type, word_count)
+        # Spread drafts around the requested length, 200 words apart
+        word_counts = list(dict.fromkeys(
+            min(WORD_COUNT_MAX, max(WORD_COUNT_MIN, word_count + 200 * (i - drafts // 2))) for i in range(drafts)
+        ))
+        
+        jobs = [lookup_job(topic, audience, content_type, wc) for wc in word_counts]
+        
+        if any(job["result"] is None for job in jobs):
+            # Generate in the background and wait for it on the following reruns
+            future, chunks = submit_generation(jobs)
+            st.session_state["pending"] = {
+                "jobs": jobs,
+                "chunks": chunks,
+                "future": future
+            }
+            st.rerun()
+        
+        st.session_state["jobs"] = jobs
+        show_jobs(jobs)
+    
+    # Poll the background generation started by an earlier run
+    pending = st.session_state.get("pending")
+    if pending:
+        if not pending["future"].done():
+            # Show the final pass as far as it has been streamed
+            if pending["chunks"]:
+                st.subheader("📄 Generating Content")
+                st.markdown("".join(pending["chunks"]))
+            with st.spinner("🤖 AI agents are working..."):
+                time.sleep(0.5)
+            st.rerun()
+        
+        del st.session_state["pending"]
+        finish_jobs(pending["jobs"], pending["future"])
+        if prefetch:
+            prefetch_variants(pending["jobs"])
+        st.session_state["jobs"] = pending["jobs"]
+        show_jobs(pending["jobs"])
+    
+    # Keep showing the latest results when another widget reruns the script
+    elif not submitted and "jobs" in st.session_state:
+        show_jobs(st.session_state["jobs"])
+    
+    stats = st.session_state.get("cache_stats")
+    if stats:
+        with stats_slot.container():
+            st.markdown("---")
+            st.caption(
+                f"⚡ Cache: {stats['hits']} hits, {stats['semantic_hits']} semantic hits, "
+                f"{stats['misses']} misses"
+            )
     
     # Footer
     st.markdown("---")
     st.caption("Powered by CrewAI, Gemini 2.5 Flash, and Serper API")
 
-def show_simulation_content(topic, audience, content_type, word_count):
-    """Show simulation content when APIs are not available."""
+@functools.lru_cache(maxsize=None)
+def _word_range(word_count):
+    """The "low-high" range string for a slider word count, built once per slider value."""
+    return f"{word_count-200}-{word_count+200}"
+
+def lookup_job(topic, audience, content_type, word_count):
+    """
+    Look a request up in the result caches.
     
-    st.markdown("### 📋 Simulation Mode")
-    st.info("Content created in simulation mode (APIs may be overloaded)")
+    Returns:
+        dict: The request, its generation "spec", its cache keys and the
+            cached "result" with its "hit" type, or a None result on a miss
+    """
+    word_range = _word_range(word_count)
+    stats = st.session_state.setdefault("cache_stats", {"hits": 0, "semantic_hits": 0, "misses": 0})
+    job = {
+        "request": (topic, audience, content_type, word_count),
+        "spec": {
+            "topic": topic,
+            "audience": audience,
+            "content_type": content_type,
+            "word_count": word_range
+        },
+        "key": _cache_key(topic, audience, content_type, word_range),
+        "query": None
+    }
+    
+    job["result"] = get_result_cache().get(job["key"])
+    if job["result"] is not None:
+        stats["hits"] += 1
+        job["hit"] = "exact"
+        return job
+    
+    job["query"] = _embed_topic(topic)
+    # Entries whose result has expired from the result cache are skipped
+    candidates = get_semantic_cache().lookup(job["query"], _semantic_shape(job)) if job["query"] is not None else []
+    for key in candidates:
+        job["result"] = get_result_cache().get(key)
+        if job["result"] is not None:
+            stats["semantic_hits"] += 1
+            job["hit"] = "semantic"
+            return job
     
-    # Simulated content
-    simulated_content = f"""
+    stats["misses"] += 1
+    return job
+
+def _semantic_shape(job):
+    """The (audience, content_type, word_range) a semantic match must share with the job."""
+    spec = job["spec"]
+    return spec["audience"], spec["content_type"], spec["word_count"]
+
+def finish_jobs(jobs, future):
+    """Fill the cache misses in jobs from a finished generation and cache the results."""
+    misses = [job for job in jobs if job["result"] is None]
+    try:
+        results = future.result()
+    except Exception as e:
+        for job in misses:
+            job["error"] = str(e)
+        return
+    
+    for job, result in zip(misses, results):
+        if result.get("status") == "error":
+            job["error"] = result.get("message")
+            continue
+        
+        job["result"] = result
+        if result.get("status") == "success":
+            # Sessions sharing one generation all finish it; only the first caches it
+            if get_result_cache().add(job["key"], result, expire=RESULT_CACHE_TTL) and job["query"] is not None:
+                get_semantic_cache().add(job["query"], _semantic_shape(job), job["key"])
+
+def prefetch_variants(jobs):
+    """
+    Queue the other content types of freshly generated jobs, so picking one later is a cache hit.
+    
+    Prefetches share the in-flight map with user submissions, so a user who
+    asks for a variant that is being prefetched joins that run, and sessions
+    sharing one generation don't queue the same prefetch twice.
+    """
+    cache = get_result_cache()
+    team = get_team()
+    for job in jobs:
+        if job.get("hit") or not job["result"] or job["result"].get("status") != "success":
+            continue
+        
+        topic, audience, content_type, _ = job["request"]
+        for variant in CONTENT_TYPES:
+            if variant == content_type:
+                continue
+            spec = {**job["spec"], "content_type": variant}
+            key = _cache_key(topic, audience, variant, spec["word_count"])
+            if key not in cache:
+                submit_once((key,), get_prefetch_executor(), prefetch_content, team, cache, key, spec)
+
+def prefetch_content(team, cache, key, spec, chunks):
+    """
+    Generate one variant into the result cache; called on the prefetch worker thread.
+    
+    Returns the same result list as generate_content, for user submissions
+    that joined this run.
+    """
+    results = generate_content(team, [spec], chunks)
+    if results[0].get("status") == "success":
+        cache.add(key, results[0], expire=RESULT_CACHE_TTL)
+    return results
+
+def show_jobs(jobs):
+    """Display one result, or one tab per draft."""
+    if len(jobs) == 1:
+        show_job(jobs[0])
+        return
+    
+    for i, (tab, job) in enumerate(zip(st.tabs([f"Draft {i+1}" for i in range(len(jobs))]), jobs)):
+        with tab:
+            show_job(job, key=f"draft_{i}")
+
+def show_job(job, key=None):
+    """Display the outcome of a single generation job."""
+    if job.get("error"):
+        st.error(f"❌ Error: {job['error']}")
+        st.info("💡 The system will fall back to simulation mode if APIs are overloaded.")
+        show_simulation_content(job, key=key)
+        return
+    
+    if job.get("hit") == "exact":
+        st.caption("⚡ Served from cache")
+    elif job.get("hit") == "semantic":
+        st.caption("🧠 Semantic hit - served from a similar earlier request")
+    show_result(job, key=key)
+
+def _is_html_document(content):
+    """Whether content starts like an HTML document, probing only its first characters."""
+    return content[:HTML_PROBE_CHARS].lstrip().lower().startswith(("<!doctype html", "<html"))
+
+def download_payload(job, content, prefix):
+    """
+    UTF-8 bytes and file name for a job's download button.
+    
+    Built on the first render and kept with the job, so later reruns neither
+    re-encode the content nor change the file name's timestamp.
+    """
+    if "download" not in job:
+        job["download"] = (content.encode("utf-8"), f"{prefix}_{datetime.now():%Y%m%d_%H%M%S}.txt")
+    return job["download"]
+
+def show_result(job, key=None):
+    """Display a content generation result."""
+    result = job["result"]
+    topic, audience, content_type, word_count = job["request"]
+    
+    if result.get("status") == "success":
+        st.success("✅ Content created successfully!")
+        
+        # Show content metadata
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Topic", topic)
+        with col2:
+            st.metric("Audience", audience)
+        with col3:
+            st.metric("Type", content_type)
+        with col4:
+            st.metric("Word Count", word_count)
+        
+        # Display the content
+        st.subheader("📄 Generated Content")
+        
+        # Extract just the content text (remove HTML if present)
+        content = result.get("result", "")
+        
+        # Only full HTML documents are parsed; markdown and plain text pass through
+        body = LexborHTMLParser(content).body if _is_html_document(content) else None
+        st.markdown(body.text() if body else content)
+        
+        # Download button
+        data, file_name = download_payload(job, content, "content")
+        st.download_button(
+            label="📥 Download Content",
+            data=data,
+            file_name=file_name,
+            mime="text/plain",
+            key=key
+        )
+    
+    else:
+        st.warning("⚠️ Content created in simulation mode")
+        show_simulation_content(job, key=key)
+
+# Markdown shown in simulation mode, filled in per request
+_SIMULATION_TEMPLATE = """
 # {topic}
 
 ## Introduction
@@ -210,15 +684,30 @@ unprecedented opportunities for {audience} to improve patient care and outcomes.
 
 *This is simulated content. For real content generation, ensure your API keys are properly configured.*
     """
+
+@st.cache_data(max_entries=128)
+def _render_simulation(topic, audience, content_type, word_count):
+    """Render the simulated content markdown for a request."""
+    return _SIMULATION_TEMPLATE.format_map(locals())
+
+def show_simulation_content(job, key=None):
+    """Show simulation content when APIs are not available."""
+    
+    st.markdown("### 📋 Simulation Mode")
+    st.info("Content created in simulation mode (APIs may be overloaded)")
+    
+    simulated_content = _render_simulation(*job["request"])
     
     st.markdown(simulated_content)
     
     # Download simulated content
+    data, file_name = download_payload(job, simulated_content, "simulated_content")
     st.download_button(
         label="📥 Download Simulated Content",
-        data=simulated_content,
-        file_name=f"simulated_content_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-        mime="text/plain"
+        data=data,
+        file_name=file_name,
+        mime="text/plain",
+        key=key
     )
 
 if __name__ == "__main__":